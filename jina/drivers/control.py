@@ -2,12 +2,19 @@ __copyright__ = "Copyright (c) 2020 Jina AI Limited. All rights reserved."
 __license__ = "Apache-2.0"
 
 import time
+from collections import defaultdict, deque
+from typing import Dict
 
 from . import BaseDriver
 from .querylang.queryset.dunderkey import dunder_get
+from ..enums import SchedulerType
 from ..excepts import UnknownControlCommand, RequestLoopEnd, NoExplicitMessage
 from ..proto import jina_pb2
 
+if False:
+    from ..peapods.peas import BasePea
+    from ..types.message import Message
+
 
 class BaseControlDriver(BaseDriver):
     """Control driver does not have access to the executor and it
@@ -68,8 +75,23 @@ class RouteDriver(ControlReqDriver):
       if it is a upstream request, use LB to schedule the receiver, mark it in the envelope
       if it is a control request in
 
+    - When all dealers are busy, the message is parked in a private per-dealer queue instead of
+      blocking the intake, it is dispatched the moment its dealer announces idle. Queues are
+      bounded, above the bound the router exerts back-pressure by pausing pollin.
+
+    - Under ``--scheduling WORK_STEALING``, a dealer that runs out of its own queue at the end of
+      a job steals parked work from the busiest peer, provided the peer backlog is above
+      ``--steal-threshold``.
     """
 
+    #: how many messages can be parked per dealer before the router pauses pollin,
+    #: overridden by ``--steal-threshold`` when the driver is attached
+    steal_threshold = 2
+
+    #: the fraction of the victim queue taken in one steal,
+    #: overridden by ``--steal-fraction`` when the driver is attached
+    steal_fraction = 0.5
+
     def __init__(self, raise_no_dealer: bool = False, *args, **kwargs):
         """
         :param raise_no_dealer: raise a RuntimeError when no available dealer
@@ -77,19 +99,81 @@ class RouteDriver(ControlReqDriver):
         :param kwargs:
         """
         super().__init__(*args, **kwargs)
-        self.idle_dealer_ids = set()
+        self.idle_dealer_ids = deque()  #: most-recently-idle dealer is dispatched first, it is the hottest in cache
+        self.dealer_ids = set()
+        self.pending_msgs = defaultdict(deque)  # type: Dict[str, deque]
         self.is_pollin_paused = False
         self.raise_no_dealer = raise_no_dealer
+        self.is_stealing = False
+
+    def attach(self, pea: 'BasePea', *args, **kwargs) -> None:
+        super().attach(pea, *args, **kwargs)
+        self.steal_threshold = getattr(pea.args, 'steal_threshold', self.steal_threshold)
+        self.steal_fraction = getattr(pea.args, 'steal_fraction', self.steal_fraction)
+        self.is_stealing = getattr(pea.args, 'scheduling', None) == SchedulerType.WORK_STEALING
+
+    @property
+    def num_pending(self) -> int:
+        """The total number of messages parked in the private dealer queues """
+        return sum(len(v) for v in self.pending_msgs.values())
+
+    @property
+    def pending_hwm(self) -> int:
+        """The high watermark of parked messages before pausing pollin """
+        return self.steal_threshold * max(1, len(self.dealer_ids))
+
+    def _steal_for(self, thief_id: str) -> bool:
+        """Steal parked work from the busiest dealer and hand it to ``thief_id``,
+        only worthwhile when the victim backlog is above :attr:`steal_threshold`.
+
+        A steal takes :attr:`steal_fraction` of the victim queue in one go, the first message is
+        dispatched right away, the rest is re-parked under the thief; batching amortizes the
+        cost of the steal operation.
+
+        :return: True when at least one message was stolen and dispatched
+        """
+        victim_id = max(self.pending_msgs, key=lambda d: len(self.pending_msgs[d]), default=None)
+        if victim_id is None or len(self.pending_msgs[victim_id]) <= self.steal_threshold:
+            return False
+        victim_pending = self.pending_msgs[victim_id]
+        num_steal = max(1, int(len(victim_pending) * self.steal_fraction))
+        self._send_to_dealer(thief_id, victim_pending.popleft())
+        thief_pending = self.pending_msgs[thief_id]
+        for _ in range(num_steal - 1):
+            thief_pending.append(victim_pending.popleft())
+        return True
+
+    def _send_to_dealer(self, dealer_id: str, msg: 'Message'):
+        """Dispatch a previously parked message to a dealer, bypassing the normal callback return """
+        msg.envelope.receiver_id = dealer_id
+        msg.update_timestamp()
+        self.pea.zmqlet.send_message(msg)
+
+    def _handle_idle_dealer(self, dealer_id: str):
+        self.dealer_ids.add(dealer_id)
+        pending = self.pending_msgs[dealer_id]
+        if pending:
+            self._send_to_dealer(dealer_id, pending.popleft())
+        elif not (self.is_stealing and self._steal_for(dealer_id)):
+            self.idle_dealer_ids.append(dealer_id)
+        if self.is_pollin_paused and self.num_pending < self.pending_hwm:
+            self.pea.zmqlet.resume_pollin()
+            self.is_pollin_paused = False
 
     def __call__(self, *args, **kwargs):
         if self.msg.is_data_request:
             self.logger.debug(self.idle_dealer_ids)
             if self.idle_dealer_ids:
-                dealer_id = self.idle_dealer_ids.pop()
-                self.envelope.receiver_id = dealer_id
-                if not self.idle_dealer_ids:
+                self.envelope.receiver_id = self.idle_dealer_ids.pop()
+            elif self.dealer_ids:
+                # all dealers are busy, park the message in the private queue of the
+                # least-loaded dealer and suppress the pass-through
+                dealer_id = min(self.dealer_ids, key=lambda d: len(self.pending_msgs[d]))
+                self.pending_msgs[dealer_id].append(self.msg)
+                if self.num_pending >= self.pending_hwm:
                     self.pea.zmqlet.pause_pollin()
                     self.is_pollin_paused = True
+                raise NoExplicitMessage
             elif self.raise_no_dealer:
                 raise RuntimeError('if this router connects more than one dealer, '
                                    'then this error should never be raised. often when it '
@@ -99,18 +183,15 @@ class RouteDriver(ControlReqDriver):
             #    this FALLBACK to trivial message pass
             #
             # Explanation on the logic here:
-            # there are two cases that when `idle_dealer_ids` is empty
+            # there are two cases that when no dealer is available
             # (1) this driver is used in a PUSH-PULL fan-out setting,
-            # where no dealer is registered in the first place, so `idle_dealer_ids` is empty
+            # where no dealer is registered in the first place, so `dealer_ids` is empty
             # all the time
             # (2) this driver is used in a ROUTER-DEALER fan-out setting,
-            # where some dealer is broken/fails to start, so `idle_dealer_ids` is empty
+            # where some dealer is broken/fails to start, so `dealer_ids` is empty
         elif self.req.command == 'IDLE':
-            self.idle_dealer_ids.add(self.envelope.receiver_id)
+            self._handle_idle_dealer(self.envelope.receiver_id)
             self.logger.debug(f'{self.envelope.receiver_id} is idle')
-            if self.is_pollin_paused:
-                self.pea.zmqlet.resume_pollin()
-                self.is_pollin_paused = False
             raise NoExplicitMessage
         else:
             super().__call__(*args, **kwargs)
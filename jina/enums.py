@@ -47,6 +47,11 @@ class EnumType(EnumMeta):
     @staticmethod
     def register_class(cls):
         reg_cls_set = getattr(cls, '_registered_class', set())
+        # precompute the string-to-member table once per enum class, so that
+        # :meth:`BetterEnum.from_string` is a single dict lookup at parse time;
+        # this happens outside the registration dedup, a re-created class must
+        # not inherit the table of its base
+        cls._string_map = {s: m for m in cls for s in (m.name, m.name.lower())}
         if cls.__name__ not in reg_cls_set or getattr(cls, 'force_register', False):
             reg_cls_set.add(cls.__name__)
             setattr(cls, '_registered_class', reg_cls_set)
@@ -61,11 +66,14 @@ class BetterEnum(IntEnum, metaclass=EnumType):
 
     @classmethod
     def from_string(cls, s: str):
-        """Parse the enum from a string"""
+        """Parse the enum from a string, a precomputed table makes it a plain dict lookup"""
         try:
-            return cls[s.upper()]
+            return cls._string_map[s]
         except KeyError:
-            raise ValueError(f'{s.upper()} is not a valid enum for {cls}')
+            try:
+                return cls._string_map[s.upper()]
+            except KeyError:
+                raise ValueError(f'{s.upper()} is not a valid enum for {cls}')
 
     @classmethod
     def _to_yaml(cls, representer, data):
@@ -91,6 +99,7 @@ class BetterEnum(IntEnum, metaclass=EnumType):
 class SchedulerType(BetterEnum):
     LOAD_BALANCE = 0  #: balance the workload between Peas, faster peas get more work
     ROUND_ROBIN = 1  #: workload are scheduled round-robin manner to the peas, assuming all peas have uniform processing speed.
+    WORK_STEALING = 2  #: like LOAD_BALANCE, but an idle pea steals parked workload from its busiest peer, see :class:`jina.drivers.control.RouteDriver`
 
 
 class PollingType(BetterEnum):
@@ -2,12 +2,31 @@ __copyright__ = "Copyright (c) 2020 Jina AI Limited. All rights reserved."
 __license__ = "Apache-2.0"
 
 import argparse
+import copy
 import os
+import threading
+from functools import lru_cache
+
+from .enums import PollingType, SchedulerType, SocketType, PeaRoleType, SkipOnErrorType, RemoteAccessType
 
 _SHOW_ALL_ARGS = 'JINA_FULL_CLI' in os.environ
 
+# the choice lists of the spawn-path parsers are frozen once at import, so that uncached parser
+# builds do not re-iterate the enums and allocate a fresh list per argument
+_POLLING_CHOICES = tuple(PollingType)
+_SCHEDULING_CHOICES = tuple(SchedulerType)
+_SOCKET_CHOICES = tuple(SocketType)
+_PEA_ROLE_CHOICES = tuple(PeaRoleType)
+_SKIP_ON_ERROR_CHOICES = tuple(SkipOnErrorType)
+_REMOTE_ACCESS_CHOICES = tuple(RemoteAccessType)
+
 
 def add_arg_group(parser, title):
+    """Get the argument group ``title`` on ``parser``, create it only when it does not exist yet;
+    reusing the group keeps mixin-style parser composition from allocating duplicate groups """
+    for group in parser._action_groups:
+        if group.title == title:
+            return group
     return parser.add_argument_group(title)
 
 
@@ -266,13 +285,80 @@ def set_flow_parser(parser=None):
     return parser
 
 
+#: serializes the first-time template builds when many peas are spawned from threads
+#: concurrently; once cached, template access is a lock-free lru_cache hit
+_parser_template_lock = threading.Lock()
+
+
+@lru_cache()
+def _build_default_pea_parser() -> 'argparse.ArgumentParser':
+    """Build the template of the default pea parser, it is built only once per process and
+    shared across threads; every caller gets its own thread-private fork of it """
+    with _parser_template_lock:
+        return set_pea_parser(set_base_parser())
+
+
+@lru_cache()
+def _build_default_pod_parser() -> 'argparse.ArgumentParser':
+    """Build the template of the default pod parser, it is built only once per process and
+    shared across threads; every caller gets its own thread-private fork of it """
+    with _parser_template_lock:
+        return set_pod_parser(set_base_parser())
+
+
+def _fork_parser(parser: 'argparse.ArgumentParser') -> 'argparse.ArgumentParser':
+    """Shallow-fork a fully built parser: the immutable grammar (actions, groups, formatter) is
+    shared with the cached template, only the mutable containers are copied. This is O(num_args)
+    versus deepcopy's walk over the whole action tree on every pea/pod spawn.
+
+    .. note::
+        The fork is meant for parsing only; adding new arguments to it would leak into the
+        shared template via the argument groups.
+    """
+    new = argparse.ArgumentParser.__new__(type(parser))
+    new.__dict__ = parser.__dict__.copy()
+    new._actions = list(parser._actions)
+    new._option_string_actions = dict(parser._option_string_actions)
+    new._defaults = dict(parser._defaults)
+    return new
+
+
+def _fresh_dynamic_defaults():
+    """Get a fresh value for every default that must be re-randomized per parser build """
+    from .helper import random_port, get_random_identity
+    return dict(identity=get_random_identity(),
+                log_id=get_random_identity(),
+                port_in=random_port(),
+                port_out=random_port(),
+                port_ctrl=os.environ.get('JINA_CONTROL_PORT', random_port()),
+                port_expose=random_port())
+
+
+def _refresh_dynamic_defaults(parser):
+    """Re-randomize the defaults that must be fresh on every parser build, i.e. ports and identities,
+    so that a parser forked from the cached template behaves as a freshly built one """
+    fresh = _fresh_dynamic_defaults()
+    for idx, action in enumerate(parser._actions):
+        if action.dest in fresh:
+            # copy-on-write: action objects are shared with the cached template,
+            # they must not be mutated in place
+            action = copy.copy(action)
+            action.default = fresh[action.dest]
+            parser._actions[idx] = action
+            for option_string in action.option_strings:
+                parser._option_string_actions[option_string] = action
+
+
 def set_pea_parser(parser=None):
-    from .enums import SocketType, PeaRoleType, SkipOnErrorType
+    if not parser:
+        # the default pea parser is requested on every pea/pod spawn,
+        # forking the cached template is much cheaper than rebuilding ~40 arguments
+        parser = _fork_parser(_build_default_pea_parser())
+        _refresh_dynamic_defaults(parser)
+        return parser
     from .helper import random_port, get_random_identity
     from . import __default_host__
 
-    if not parser:
-        parser = set_base_parser()
     gp0 = add_arg_group(parser, 'pea basic arguments')
     gp0.add_argument('--name', type=str,
                      help='the name of this pea, used to identify the pod and its logs.')
@@ -316,10 +402,10 @@ def set_pea_parser(parser=None):
                      help=f'host address for input, by default it is {__default_host__}')
     gp2.add_argument('--host-out', type=str, default=__default_host__,
                      help=f'host address for output, by default it is {__default_host__}')
-    gp2.add_argument('--socket-in', type=SocketType.from_string, choices=list(SocketType),
+    gp2.add_argument('--socket-in', type=SocketType.from_string, choices=_SOCKET_CHOICES,
                      default=SocketType.PULL_BIND,
                      help='socket type for input port')
-    gp2.add_argument('--socket-out', type=SocketType.from_string, choices=list(SocketType),
+    gp2.add_argument('--socket-out', type=SocketType.from_string, choices=_SOCKET_CHOICES,
                      default=SocketType.PUSH_BIND,
                      help='socket type for output port')
     gp2.add_argument('--port-ctrl', type=int, default=os.environ.get('JINA_CONTROL_PORT', random_port()),
@@ -354,9 +440,9 @@ def set_pea_parser(parser=None):
     gp5.add_argument('--num-part', type=int, default=0,
                      help='the number of messages expected from upstream, 0 and 1 means single part'
                      if _SHOW_ALL_ARGS else argparse.SUPPRESS)
-    gp5.add_argument('--role', type=PeaRoleType.from_string, choices=list(PeaRoleType),
+    gp5.add_argument('--role', type=PeaRoleType.from_string, choices=_PEA_ROLE_CHOICES,
                      help='the role of this pea in a pod' if _SHOW_ALL_ARGS else argparse.SUPPRESS)
-    gp5.add_argument('--skip-on-error', type=SkipOnErrorType.from_string, choices=list(SkipOnErrorType),
+    gp5.add_argument('--skip-on-error', type=SkipOnErrorType.from_string, choices=_SKIP_ON_ERROR_CHOICES,
                      default=SkipOnErrorType.NONE,
                      help='skip strategy on error message.')
 
@@ -366,6 +452,11 @@ def set_pea_parser(parser=None):
                           '-1 means no restriction')
     gp6.add_argument('--runtime', type=str, choices=['thread', 'process'], default='process',
                      help='the parallel runtime of the pod')
+    gp6.add_argument('--cpu-affinity', type=str, default=None,
+                     help='pin this pea to specific CPUs to improve cache locality, '
+                          'either a comma-separated list of CPU ids or "auto" to spread '
+                          'parallel peas over all CPUs round-robin; '
+                          'it requires os.sched_setaffinity, i.e. Linux only')
     gp6.add_argument('--max-idle-time', type=int, default=60,
                      help='label this pea as inactive when it does not '
                           'process any request after certain time (in second)')
@@ -398,35 +489,148 @@ def set_pea_parser(parser=None):
     return parser
 
 
+#: the arguments a pod adds on top of a pea, as (flags, kwargs) pairs evaluated once at import,
+#: so building a pod parser is a single loop instead of a chain of function calls
+_POD_ARG_SPECS = (
+    (('--parallel', '--shards'),
+     dict(type=int, default=1,
+          help='number of parallel peas in the pod running at the same time, '
+               '`port_in` and `port_out` will be set to random, '
+               'and routers will be added automatically when necessary')),
+    (('--polling',),
+     dict(type=PollingType.from_string, choices=_POLLING_CHOICES,
+          default=PollingType.ANY,
+          help='ANY: only one (whoever is idle) replica polls the message; '
+               'ALL: all workers poll the message (like a broadcast)')),
+    (('--scheduling',),
+     dict(type=SchedulerType.from_string, choices=_SCHEDULING_CHOICES,
+          default=SchedulerType.LOAD_BALANCE,
+          help='the strategy of scheduling workload among peas')),
+    (('--uses-before',),
+     dict(type=str,
+          help='the executor used before sending to all parallels, '
+               'accepted type follows "--uses"')),
+    (('--uses-after',),
+     dict(type=str,
+          help='the executor used after receiving from all parallels, '
+               'accepted type follows "--uses"')),
+    (('--shutdown-idle',),
+     dict(action='store_true', default=False,
+          help='shutdown this pod when all peas are idle')),
+    (('--steal-threshold',),
+     dict(type=int, default=2,
+          help='an idle pea only steals work from a peer when the peer has more than this number of '
+               'parked messages, it also bounds the per-pea backlog in the router; '
+               'only effective when `--scheduling WORK_STEALING` and `--parallel` > 1')),
+    (('--steal-fraction',),
+     dict(type=float, default=0.5,
+          help='the fraction of the victim\'s parked messages a stealing pea takes in one steal, '
+               'stealing a batch amortizes the cost of the steal operation; '
+               'only effective when `--scheduling WORK_STEALING` and `--parallel` > 1')),
+)
+
+
 def set_pod_parser(parser=None):
-    from .enums import PollingType, SchedulerType
     if not parser:
-        parser = set_base_parser()
+        parser = _fork_parser(_build_default_pod_parser())
+        _refresh_dynamic_defaults(parser)
+        return parser
     set_pea_parser(parser)
 
     gp4 = add_arg_group(parser, 'pod replica arguments')
-    gp4.add_argument('--parallel', '--shards', type=int, default=1,
-                     help='number of parallel peas in the pod running at the same time, '
-                          '`port_in` and `port_out` will be set to random, '
-                          'and routers will be added automatically when necessary')
-    gp4.add_argument('--polling', type=PollingType.from_string, choices=list(PollingType),
-                     default=PollingType.ANY,
-                     help='ANY: only one (whoever is idle) replica polls the message; '
-                          'ALL: all workers poll the message (like a broadcast)')
-    gp4.add_argument('--scheduling', type=SchedulerType.from_string, choices=list(SchedulerType),
-                     default=SchedulerType.LOAD_BALANCE,
-                     help='the strategy of scheduling workload among peas')
-    gp4.add_argument('--uses-before', type=str,
-                     help='the executor used before sending to all parallels, '
-                          'accepted type follows "--uses"')
-    gp4.add_argument('--uses-after', type=str,
-                     help='the executor used after receiving from all parallels, '
-                          'accepted type follows "--uses"')
-    gp4.add_argument('--shutdown-idle', action='store_true', default=False,
-                     help='shutdown this pod when all peas are idle')
+    for flags, kwargs in _POD_ARG_SPECS:
+        gp4.add_argument(*flags, **kwargs)
     return parser
 
 
+def _fast_parse_pod_args(argv):
+    """Parse pod CLI arguments against the default pod parser without going through argparse.
+
+    Only plain ``--key value``/``--key=value`` options and ``store_true`` flags are handled,
+    which covers the stable set of spawn-time arguments; argparse's option matching, help
+    machinery and abbreviation handling are bypassed entirely.
+
+    :param argv: the pod CLI arguments as a sequence of strings
+    :return: a Namespace equivalent to ``set_pod_parser().parse_args(argv)``, or None when
+        anything outside the fast path appears (unknown/abbreviated flags, nargs, positionals),
+        in which case the caller must fall back to full argparse
+    """
+    option_actions = _build_default_pod_parser()._option_string_actions
+    values = {}
+    i = 0
+    while i < len(argv):
+        tok = argv[i]
+        i += 1
+        if not tok.startswith('--'):
+            return None
+        key, eq, inline_val = tok.partition('=')
+        action = option_actions.get(key)
+        if action is None:
+            # unknown (or abbreviated) flag, argparse has to judge it
+            return None
+        if isinstance(action, argparse._StoreTrueAction):
+            if eq:
+                return None
+            values[action.dest] = True
+        elif type(action) is argparse._StoreAction and action.nargs is None:
+            if eq:
+                val = inline_val
+            elif i < len(argv):
+                val = argv[i]
+                i += 1
+            else:
+                return None
+            try:
+                val = action.type(val) if callable(action.type) else val
+            except (TypeError, ValueError, KeyError):
+                # let argparse produce its proper error message
+                return None
+            if action.choices is not None and val not in action.choices:
+                return None
+            values[action.dest] = val
+        else:
+            return None
+
+    for dest, value in _fresh_dynamic_defaults().items():
+        values.setdefault(dest, value)
+
+    ns = argparse.Namespace()
+    for action in _build_default_pod_parser()._actions:
+        if action.dest is argparse.SUPPRESS or action.default is argparse.SUPPRESS:
+            continue
+        val = values.get(action.dest, action.default)
+        if isinstance(val, str) and callable(action.type):
+            # argparse applies the type conversion to string defaults as well
+            val = action.type(val)
+        setattr(ns, action.dest, val)
+    return ns
+
+
+@lru_cache(maxsize=128)
+def _parse_pod_args_cached(argv: tuple) -> 'argparse.Namespace':
+    ns = _fast_parse_pod_args(argv)
+    if ns is None:
+        ns = set_pod_parser().parse_args(argv)
+    return ns
+
+
+def parse_pod_args(argv) -> 'argparse.Namespace':
+    """Parse pod CLI arguments, memoized on identical ``argv``.
+
+    Repeated spawns with the same argv skip argparse entirely and cost a dict lookup plus a
+    shallow copy. The copy keeps mutation semantics for the caller; note that the randomized
+    defaults (ports, identity) are shared between cache hits, so arguments that must differ
+    between two pods have to be given explicitly.
+
+    This is safe to call from concurrently spawning threads: the cache itself is thread-safe
+    and every caller receives a private Namespace copy, cached ones are never handed out for
+    mutation.
+
+    :param argv: the pod CLI arguments as a list of strings
+    """
+    return copy.copy(_parse_pod_args_cached(tuple(argv)))
+
+
 def set_ping_parser(parser=None):
     if not parser:
         parser = set_base_parser()
@@ -471,7 +675,6 @@ def _set_grpc_parser(parser=None):
         parser = set_base_parser()
     from .helper import random_port
     from . import __default_host__
-    from .enums import RemoteAccessType
     gp1 = add_arg_group(parser, 'grpc and remote arguments')
     gp1.add_argument('--host', type=str, default=__default_host__,
                      help=f'host address of the pea/gateway, by default it is {__default_host__}.')
@@ -485,7 +688,7 @@ def _set_grpc_parser(parser=None):
                      help='respect the http_proxy and https_proxy environment variables. '
                           'otherwise, it will unset these proxy variables before start. '
                           'gRPC seems to prefer no proxy')
-    gp1.add_argument('--remote-access', choices=list(RemoteAccessType),
+    gp1.add_argument('--remote-access', choices=_REMOTE_ACCESS_CHOICES,
                      default=RemoteAccessType.JINAD,
                      type=RemoteAccessType.from_string,
                      help=f'host address of the pea/gateway, by default it is {__default_host__}.')
@@ -518,7 +721,7 @@ def _set_grpc_parser(parser=None):
 
 
 def set_gateway_parser(parser=None):
-    from .enums import SocketType, CompressAlgo
+    from .enums import CompressAlgo
     if not parser:
         parser = set_base_parser()
     set_pea_parser(parser)
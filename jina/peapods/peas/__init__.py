@@ -254,6 +254,30 @@ class BasePea(ExitStack):
         is_ready_event.set()
         self.zmqlet.start(self.msg_callback)
 
+    def set_cpu_affinity(self):
+        """Pin this pea to the CPUs given by the ``cpu-affinity`` CLI argument, so the OS does not
+        migrate it between cores and invalidate its caches. No-op when the argument is unset or the
+        platform has no :func:`os.sched_setaffinity` (i.e. non-Linux). """
+        affinity = getattr(self.args, 'cpu_affinity', None)
+        if not affinity:
+            return
+        if getattr(self.args, 'runtime', None) == 'thread':
+            # affinity is process-wide, pinning here would collapse all thread-peas onto one core
+            self.logger.warning('cpu-affinity is ignored when runtime="thread"')
+            return
+        if not hasattr(os, 'sched_setaffinity'):
+            self.logger.warning('cpu-affinity is ignored as this platform does not support os.sched_setaffinity')
+            return
+        try:
+            if affinity == 'auto':
+                cpus = {max(self.args.pea_id, 0) % os.cpu_count()}
+            else:
+                cpus = {int(v) for v in affinity.split(',')}
+            os.sched_setaffinity(0, cpus)
+            self.logger.info(f'pinned to CPU {sorted(cpus)}')
+        except (ValueError, OSError) as ex:
+            self.logger.warning(f'fail to set cpu affinity to {affinity}: {repr(ex)}')
+
     def load_plugins(self):
         """Loads the plugins if needed necessary to load executors
         """
@@ -278,6 +302,8 @@ class BasePea(ExitStack):
     def run(self, is_ready_event: 'Event'):
         """Start the request loop of this BasePea. It will listen to the network protobuf message via ZeroMQ. """
         try:
+            # must be done here as this runs inside the spawned process/thread
+            self.set_cpu_affinity()
             # Every logger created in this process will be identified by the `Pod Id` and use the same name
             self.request_loop(is_ready_event)
         except KeyboardInterrupt:
@@ -50,6 +50,9 @@ class BasePod(ExitStack):
         while True:
             if self.is_idle:
                 self.close()
+                # stop the sentinel here, otherwise it keeps probing the
+                # control sockets of already-closed peas every second
+                break
             time.sleep(1)
 
     @property
@@ -22,7 +22,7 @@ def _set_peas_args(args: Namespace, head_args: Namespace = None, tail_args: Name
         if args.polling.is_push:
             if args.scheduling == SchedulerType.ROUND_ROBIN:
                 _args.socket_in = SocketType.PULL_CONNECT
-            elif args.scheduling == SchedulerType.LOAD_BALANCE:
+            elif args.scheduling in (SchedulerType.LOAD_BALANCE, SchedulerType.WORK_STEALING):
                 _args.socket_in = SocketType.DEALER_CONNECT
             else:
                 raise NotImplementedError
@@ -57,7 +57,7 @@ def _copy_to_head_args(args: Namespace, is_push: bool, as_router: bool = True) -
             _head_args.socket_out = SocketType.PUSH_BIND
             if as_router:
                 _head_args.uses = args.uses_before or '_pass'
-        elif args.scheduling == SchedulerType.LOAD_BALANCE:
+        elif args.scheduling in (SchedulerType.LOAD_BALANCE, SchedulerType.WORK_STEALING):
             _head_args.socket_out = SocketType.ROUTER_BIND
             if as_router:
                 _head_args.uses = args.uses_before or '_pass'
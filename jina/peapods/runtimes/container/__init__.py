@@ -4,7 +4,7 @@ __license__ = "Apache-2.0"
 import argparse
 import asyncio
 import os
-import time
+import threading
 from pathlib import Path
 from typing import Dict, Union
 
@@ -118,13 +118,17 @@ class ContainerRuntime(BaseRuntime):
 
     def _monitor_pea_in_container(self):
         """Direct the log from the container to local console """
+        stop_ready_check = threading.Event()
 
         def check_ready():
-            while not self.is_ready:
-                time.sleep(0.1)
-            self.is_ready_event.set()
-            self.logger.success(__ready_msg__)
-            return True
+            while not stop_ready_check.is_set():
+                if self.is_ready:
+                    self.is_ready_event.set()
+                    self.logger.success(__ready_msg__)
+                    break
+                # wait on the event instead of a plain sleep, so the checker is woken up
+                # and released immediately when the monitoring ends
+                stop_ready_check.wait(0.1)
 
         async def _loop_body():
             import docker
@@ -139,6 +143,10 @@ class ContainerRuntime(BaseRuntime):
                         logger.info(line.strip().decode())
                 except docker.errors.NotFound:
                     self.logger.error('the container can not be started, check your arguments, entrypoint')
+                finally:
+                    # without this, a pea that never becomes ready would keep the checker
+                    # spinning and block the executor shutdown of asyncio.run forever
+                    stop_ready_check.set()
 
         asyncio.run(_loop_body())
 
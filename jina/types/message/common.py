@@ -8,6 +8,8 @@ __all__ = ['ControlMessage']
 
 
 class ControlMessage(Message):
+    __slots__ = ()
+
     def __init__(self, command: str, pod_name: str = 'ctl', identity: str = '',
                  *args, **kwargs):
         req = Request(jina_pb2.RequestProto())
@@ -2,7 +2,7 @@ import subprocess
 
 import pytest
 
-from jina.parser import set_pod_parser
+from jina.parser import set_pod_parser, parse_pod_args
 
 
 @pytest.mark.parametrize('cli', ['pod', 'pea', 'gateway', 'log',
@@ -15,6 +15,57 @@ def test_main_cli():
     subprocess.check_call(['jina'])
 
 
+def test_pod_parser_fresh_defaults():
+    # the default parser is built from a cached template,
+    # but ports and identities must be fresh on every build
+    a1 = set_pod_parser().parse_args([])
+    a2 = set_pod_parser().parse_args([])
+    assert a1.identity != a2.identity
+    assert (a1.port_in, a1.port_out, a1.port_ctrl) != (a2.port_in, a2.port_out, a2.port_ctrl)
+
+
+def test_pod_parser_work_stealing_args():
+    from jina.enums import SchedulerType
+    a = set_pod_parser().parse_args(['--scheduling', 'WORK_STEALING',
+                                     '--steal-threshold', '4',
+                                     '--steal-fraction', '0.25'])
+    assert a.scheduling == SchedulerType.WORK_STEALING
+    assert a.steal_threshold == 4
+    assert a.steal_fraction == 0.25
+
+
+def test_parse_pod_args_memoized():
+    a1 = parse_pod_args(['--parallel', '3'])
+    a2 = parse_pod_args(['--parallel', '3'])
+    assert a1 is not a2
+    assert vars(a1) == vars(a2)
+    # the copy keeps mutation semantics
+    a1.parallel = 5
+    assert a2.parallel == 3
+
+
+@pytest.mark.parametrize('argv', [[],
+                                  ['--parallel', '2', '--polling', 'ALL'],
+                                  ['--uses', '_pass', '--read-only'],
+                                  ['--parallel=3', '--timeout', '-1']])
+def test_fast_pod_args_matches_argparse(argv):
+    from jina.parser import _fast_parse_pod_args
+    dynamic = {'identity', 'log_id', 'port_in', 'port_out', 'port_ctrl', 'port_expose'}
+    fast = _fast_parse_pod_args(tuple(argv))
+    full = set_pod_parser().parse_args(argv)
+    assert fast is not None
+    assert {k: v for k, v in vars(fast).items() if k not in dynamic} == \
+           {k: v for k, v in vars(full).items() if k not in dynamic}
+
+
+def test_fast_pod_args_falls_back():
+    from jina.parser import _fast_parse_pod_args
+    # nargs, unknown flags and bad values are left to argparse
+    assert _fast_parse_pod_args(('--env', 'a=b')) is None
+    assert _fast_parse_pod_args(('--not-a-flag', '1')) is None
+    assert _fast_parse_pod_args(('--parallel', 'two')) is None
+
+
 def test_parse_env_map():
     a = set_pod_parser().parse_args(['--env', 'key1=value1',
                                      '--env', 'key2=value2'])